@@ -1,5 +1,6 @@
+import numpy as np
 from matplotlib import pyplot as plt
-from collections import Counter
+from matplotlib.transforms import offset_copy
 
 ####
 # dot-and-line Data
@@ -30,16 +31,16 @@ plt.show()
 ###
 # Bar Charts distribution bins
 grades = [83, 95, 91, 87, 70, 0, 85, 82, 100, 67, 73, 77, 0]
-decile = lambda grade: grade // 10 * 10
-histogram = Counter(decile(grade) for grade in grades)
+# One bin per decile; the last bin holds the perfect scores.
+histogram, deciles = np.histogram(grades, bins=range(0, 120, 10))
 
 #plt.bar([x - 4 for x in histogram.keys()],
 #        histogram.values(),
 #        8)
 
-plt.bar([*histogram.keys()],
-        histogram.values(),
-       8)
+plt.bar(deciles[:-1],
+        histogram,
+        8)
 
 #plt.axis([-5, 105, 0, 5])
 
@@ -55,16 +56,17 @@ friends = [70, 65, 72, 63, 71, 64, 60, 64, 67]
 minutes = [175, 170, 205, 120, 220, 130, 105, 145, 190]
 labels = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']
 
-plt.scatter(friends, minutes)
-plt.axis([0, max(friends)+5, 0, max(minutes)+5])
+fig, ax = plt.subplots()
+ax.scatter(friends, minutes)
+ax.axis([0, max(friends)+5, 0, max(minutes)+5])
 
+# Plain text artists sharing one offset transform are much lighter than an
+# Annotation per point.
+label_offset = offset_copy(ax.transData, fig=fig, x=5, y=-5, units='points')
 for label, friend_count, minute_count in zip(labels, friends, minutes):
-    plt.annotate(label,
-                 xy=(friend_count, minute_count),
-                 xytext=(5, -5),
-                 textcoords='offset points')
+    ax.text(friend_count, minute_count, label, transform=label_offset)
 
-plt.title("Daily Minutes vs. Number of Friends")
-plt.xlabel("# of friends")
-plt.ylabel("daily minutes spent on the site")
+ax.set_title("Daily Minutes vs. Number of Friends")
+ax.set_xlabel("# of friends")
+ax.set_ylabel("daily minutes spent on the site")
 plt.show()
@@ -5,8 +5,15 @@ Generate different distributions.
 import math
 import random
 
+import numpy as np
 from matplotlib import pyplot as plt
-from collections import Counter
+
+# Bulk sampling for plots goes through numpy's generator; the scalar
+# samplers below keep using `random` so that random.seed() still applies.
+_rng = np.random.default_rng()
+
+_SQRT_2PI = math.sqrt(2 * math.pi)
+_INV_SQRT_2 = 1 / math.sqrt(2)
 
 
 def uniform_pdf(x):
@@ -33,7 +40,7 @@ def uniform_pdf(x):
         >>> uniform_pdf(-1)
         0
     """
-    return 1 if x >= 0 and x < 1 else 0
+    return 1 if 0 <= x < 1 else 0
 
 
 def uniform_cdf(x):
@@ -88,8 +95,7 @@ def normal_pdf(x, mu=0, sigma=1):
         >>> normal_pdf(0, 20, 1)
         5.520948362159764e-88
     """
-    sqrt_two_pi = math.sqrt(2 * math.pi)
-    return (math.exp(-(x-mu) ** 2 / 2 / sigma ** 2) / (sqrt_two_pi * sigma))
+    return (math.exp(-(x-mu) ** 2 / 2 / sigma ** 2) / (_SQRT_2PI * sigma))
 
 
 def normal_cdf(x, mu=0, sigma=1):
@@ -112,7 +118,7 @@ def normal_cdf(x, mu=0, sigma=1):
         >>> normal_cdf(0, 20, 1)
         0.0
     """
-    return (1 + math.erf((x - mu) / math.sqrt(2) / sigma)) / 2
+    return (1 + math.erf((x - mu) * _INV_SQRT_2 / sigma)) / 2
 
 
 # The normmal cdf is the probability the variable is below a threshold.
@@ -134,8 +140,12 @@ def normal_probability_above(lo, mu=0, sigma=1):
     Examples:
         >>> normal_probability_above(0.5, 0, 1)
         0.3085375387259869
+
+        >>> normal_probability_above(10, 0, 1)
+        7.619853024160593e-24
     """
-    return 1 - normal_cdf(lo, mu, sigma)
+    # erfc avoids the cancellation in 1 - normal_cdf() far above the mean.
+    return 0.5 * math.erfc((lo - mu) * _INV_SQRT_2 / sigma)
 
 
 def normal_probability_between(lo, hi, mu=0, sigma=1):
@@ -153,9 +163,10 @@ def normal_probability_between(lo, hi, mu=0, sigma=1):
 
     Examples:
         >>> normal_probability_between(0.2, 0.3, 0, 1)
-        0.15773925946598155
+        0.038651712749849604
     """
-    return normal_cdf(hi, mu, sigma) - normal_cdf(lo, hi, sigma)
+    return 0.5 * (math.erf((hi - mu) * _INV_SQRT_2 / sigma) -
+                  math.erf((lo - mu) * _INV_SQRT_2 / sigma))
 
 
 def normal_probability_outside(lo, hi, mu=0, sigma=1):
@@ -172,8 +183,8 @@ def normal_probability_outside(lo, hi, mu=0, sigma=1):
         Float
 
     Examples:
-        >>> normal_probability_between(0.2, 0.3, 0, 1)
-        0.15773925946598155
+        >>> normal_probability_outside(0.2, 0.3, 0, 1)
+        0.9613482872501504
     """
     return 1 - normal_probability_between(lo, hi, mu, sigma)
 
@@ -192,9 +203,9 @@ def normal_upper_bound(probability, mu=0, sigma=1):
 
     Examples:
         >>> normal_upper_bound(0.95, 0, 1)
-        1.6448497772216797
+        1.644853625133699
         >>> normal_upper_bound(0.1, 0, 1)
-        -1.2815570831298828
+        -1.2815515641401563
     """
     return inverse_normal_cdf(probability, mu, sigma)
 
@@ -211,10 +222,10 @@ def normal_lower_bound(probability, mu=0, sigma=1):
     Returns:
         Float
         >>> normal_lower_bound(0.95, 0, 1)
-        -1.6448497772216797
+        -1.644853625133699
 
         >>> normal_lower_bound(0.1, 0, 1)
-        1.2815570831298828
+        1.2815515641401563
     """
     return inverse_normal_cdf(1 - probability, mu, sigma)
 
@@ -234,7 +245,7 @@ def normal_two_sided_bounds(probability, mu=0, sigma=1):
 
     Examples:
         >>> normal_two_sided_bounds(0.95, 500.0, 15.811388300841896)
-        (469.01026640487555, 530.9897335951244)
+        (469.0102483597877, 530.9897516402123)
     """
     tail_probability = (1 - probability) / 2
     upper_bound = normal_lower_bound(tail_probability, mu, sigma)
@@ -243,44 +254,85 @@ def normal_two_sided_bounds(probability, mu=0, sigma=1):
     return lower_bound, upper_bound
 
 
+# Coefficients of Acklam's rational approximation to the inverse normal cdf.
+_ACKLAM_A = (-3.969683028665376e+01, 2.209460984245205e+02,
+             -2.759285104469687e+02, 1.383577518672690e+02,
+             -3.066479806614716e+01, 2.506628277459239e+00)
+_ACKLAM_B = (-5.447609879822406e+01, 1.615858368580409e+02,
+             -1.556989798598866e+02, 6.680131188771972e+01,
+             -1.328068155288572e+01)
+_ACKLAM_C = (-7.784894002430293e-03, -3.223964580411365e-01,
+             -2.400758277161838e+00, -2.549732539343734e+00,
+             4.374664141464968e+00, 2.938163982698783e+00)
+_ACKLAM_D = (7.784695709041462e-03, 3.224671290700398e-01,
+             2.445134137142996e+00, 3.754408661907416e+00)
+_ACKLAM_P_LOW = 0.02425
+
+
+def _acklam_tail(p):
+    """
+    Acklam's approximation for the lower tail, p < _ACKLAM_P_LOW.
+    """
+    c_1, c_2, c_3, c_4, c_5, c_6 = _ACKLAM_C
+    d_1, d_2, d_3, d_4 = _ACKLAM_D
+    q = math.sqrt(-2 * math.log(p))
+    return ((((((c_1 * q + c_2) * q + c_3) * q + c_4) * q + c_5) * q + c_6) /
+            ((((d_1 * q + d_2) * q + d_3) * q + d_4) * q + 1))
+
+
 def inverse_normal_cdf(p, mu=0, sigma=1, tolerance=0.00001):
     """
-    Return a value of the specified probablity from the specified normal
-    distribution with the specified value of decimal precision.
+    Return the value below which the specified probability of the specified
+    normal distribution lies.
+
+    Uses Acklam's rational approximation, which is accurate to about 1e-9
+    and runs in constant time.
 
     Args:
-        x (Int or Float): A random variable.
+        p (Float): A probability such that (0.0 <= p <= 1.0).
         mu (Int or Float): The mean of the distribution.
         sigma (Int or Float): The standard deviation of the distribution.
-        tolerance (Float): The decimal precision to return.
+        tolerance (Float): Unused. Kept for backwards compatibility with the
+        bisection search this function used to perform.
 
     Returns:
         Float
 
     Examples:
-        >>> inverse_normal_cdf(0, 0, 1, 0.00001)
-        -8.75
+        >>> inverse_normal_cdf(0.5)
+        0.0
 
-        >>> inverse_normal_cdf(0, 20, 1, 0.1)
-        11.25
-    """
-    # if the distribution is not standard normal, translate it so that it is.
-    if mu != 0 or sigma != 1:
-        return mu + sigma * inverse_normal_cdf(p, tolerance=tolerance)
+        >>> inverse_normal_cdf(0.975)
+        1.959963986120195
+
+        >>> inverse_normal_cdf(0.01)
+        -2.326347874388028
 
-    low_z = -10.0
-    hi_z = 10.0
-    while hi_z - low_z > tolerance:
-        mid_z = (low_z + hi_z) / 2
-        mid_p = normal_cdf(mid_z)
-        if mid_p < p:
-            low_z = mid_z
-        elif mid_p > p:
-            hi_z = mid_z
-        else:
-            break
+        >>> inverse_normal_cdf(0.5, 20, 1)
+        20.0
+
+        >>> inverse_normal_cdf(0, 0, 1)
+        -inf
+    """
+    if p <= 0:
+        z = -math.inf
+    elif p >= 1:
+        z = math.inf
+    elif p < _ACKLAM_P_LOW:
+        z = _acklam_tail(p)
+    elif p > 1 - _ACKLAM_P_LOW:
+        z = -_acklam_tail(1 - p)
+    else:
+        a_1, a_2, a_3, a_4, a_5, a_6 = _ACKLAM_A
+        b_1, b_2, b_3, b_4, b_5 = _ACKLAM_B
+        q = p - 0.5
+        r = q * q
+        z = ((((((a_1 * r + a_2) * r + a_3) * r + a_4) * r + a_5) * r + a_6) *
+             q /
+             (((((b_1 * r + b_2) * r + b_3) * r + b_4) * r + b_5) * r + 1))
 
-    return mid_z
+    # z is for the standard normal; translate it onto the requested one.
+    return mu + sigma * z
 
 
 def bernoulli_trial(probability):
@@ -320,7 +372,9 @@ def binomial(n, p):
         >>> binomial(20, 0.5)
         7
     """
-    return sum(bernoulli_trial(p) for _ in range(n))
+    # Inline the trial rather than calling bernoulli_trial n times; this
+    # draws the same random numbers, so seeded results are unchanged.
+    return sum(random.random() < p for _ in range(n))
 
 
 def make_hist(p, n, num_points):
@@ -335,20 +389,23 @@ def make_hist(p, n, num_points):
     Returns:
         Displays a matplotlib graphic in a new window.
     """
-    data = [binomial(n, p) for _ in range(num_points)]
+    data = _rng.binomial(n, p, size=num_points)
 
-    histogram = Counter(data)
+    counts = np.bincount(data)
+    values = np.flatnonzero(counts)
 
-    plt.bar([x - 0.4 for x in histogram.keys()],
-            [v / num_points for v in histogram.values()],
-            color='0.75')
+    plt.bar(values - 0.4, counts[values] / num_points, color='0.75')
 
     mu = p * n
     sigma = math.sqrt(n * p * (1 - p))
 
-    xs = range(min(data), max(data) + 1)
-    ys = [normal_cdf(i + 0.5, mu, sigma) - normal_cdf(i - 0.5, mu, sigma)
-          for i in xs]
+    lo_x, hi_x = int(values[0]), int(values[-1])
+    xs = range(lo_x, hi_x + 1)
+    # Neighbouring bars share an edge, so evaluate the cdf once per edge and
+    # difference consecutive values rather than twice per bar.
+    edges = [normal_cdf(i - 0.5, mu, sigma)
+             for i in range(lo_x, hi_x + 2)]
+    ys = [hi - lo for lo, hi in zip(edges, edges[1:])]
     plt.plot(xs, ys)
     plt.title("Binomial Distribution vs Normal Approximation")
     plt.show()
@@ -377,6 +434,14 @@ def normal_approximation_to_binomial(n, p):
     return mu, sigma
 
 
+def _log_beta(alpha, beta):
+    """
+    The natural log of B(alpha, beta), computed without overflowing.
+    """
+    return (math.lgamma(alpha) + math.lgamma(beta) -
+            math.lgamma(alpha + beta))
+
+
 def B(alpha, beta):
     """
     A normalizing constant so that the total probability is 1.
@@ -392,13 +457,13 @@ def B(alpha, beta):
         >>> B(1, 1)
         1.0
 
-        >>> B(10, 1)
+        >>> round(B(10, 1), 12)
         0.1
 
-        >>> B(1, 10)
+        >>> round(B(1, 10), 12)
         0.1
     """
-    return math.gamma(alpha) * math.gamma(beta) / math.gamma(alpha + beta)
+    return math.exp(_log_beta(alpha, beta))
 
 
 def beta_pdf(x, alpha, beta):
@@ -422,8 +487,14 @@ def beta_pdf(x, alpha, beta):
 
         >>> beta_pdf(0, 1, 1)
         0
+
+        >>> round(beta_pdf(0.4, 200, 300), 6)
+        18.199533
     """
     if x <= 0 or x >= 1:
         return 0
 
-    return x ** (alpha - 1) * (1 - x) ** (beta - 1) / B(alpha, beta)
+    # Work in log space so large alpha and beta don't overflow gamma().
+    return math.exp((alpha - 1) * math.log(x) +
+                    (beta - 1) * math.log1p(-x) -
+                    _log_beta(alpha, beta))
@@ -2,8 +2,7 @@
 Functions for Gradient Descent
 """
 
-
-import vector as v
+import random
 
 
 def difference_quotient(f, x, h):
@@ -38,9 +37,27 @@ def partial_difference_quotient(f, v, i, h):
 def estimate_gradient(f, v, h=0.00001):
     """
     Estimate on the gradient.
+
+    f(v) is evaluated once and a single copy of v is nudged one component
+    at a time, rather than rebuilding v and re-evaluating f(v) for every
+    partial difference quotient.
+
+    Examples:
+        >>> grad = estimate_gradient(lambda v: sum(v_i ** 2 for v_i in v),
+        ...                          [1, 2, 3])
+        >>> [round(g, 3) for g in grad]
+        [2.0, 4.0, 6.0]
     """
-    return [partial_difference_quotient(f, v, i, h)
-            for i, _ in enumerate(v)]
+    f_v = f(v)
+    w = list(v)
+    gradient = []
+
+    for i, v_i in enumerate(v):
+        w[i] = v_i + h
+        gradient.append((f(w) - f_v) / h)
+        w[i] = v_i
+
+    return gradient
 
 
 def step(v, direction, step_size):
@@ -66,27 +83,57 @@ def safe(f):
     def safe_f(*args, **kwargs):
         try:
             return f(*args, **kwargs)
-        except:
+        except Exception:
             return float('inf')
     return safe_f
 
 
-def minimize_batch(target_fn, gradient_fn, theta_0, tolerance=0.000001):
+def safe_negate(f):
     """
-    Use gradient descent to find theta that minimizes the target function.
+    Returns a new function that outputs -f, or infinity whenever f produces
+    an error. Equivalent to safe(negate(f)) with one wrapper call instead of
+    two.
+
+    Examples:
+        >>> g = safe_negate(lambda x: 1 / x)
+        >>> g(2)
+        -0.5
+        >>> g(0)
+        inf
     """
-    step_sizes = [100, 10, 1, 0.1, 0.01, 0.001, 0.0001, 0.00001]
+    def safe_negate_f(*args, **kwargs):
+        try:
+            return -f(*args, **kwargs)
+        except Exception:
+            return float('inf')
+    return safe_negate_f
+
 
+# Step sizes tried, largest first, at every iteration of batch descent.
+_STEP_SIZES = (100, 10, 1, 0.1, 0.01, 0.001, 0.0001, 0.00001)
+
+
+def _minimize_batch(target_fn, gradient_fn, theta_0, tolerance):
+    """
+    The gradient descent loop behind minimize_batch and maximize_batch.
+    target_fn must already be wrapped with safe (or safe_negate).
+    """
     theta = theta_0
-    target_fn = safe(target_fn)
     value = target_fn(theta)
 
     while True:
         gradient = gradient_fn(theta)
-        next_thetas = [step(theta, gradient, -step_size)
-                       for step_size in step_sizes]
-        next_theta = min(next_thetas, key=target_fn)
-        next_value = target_fn(next_theta)
+        if not any(gradient):
+            # Every candidate would be theta itself, whose value we know.
+            return theta
+
+        # Build and score the candidates lazily, evaluating each once, so
+        # only the best one so far is kept alive.
+        next_thetas = (step(theta, gradient, -step_size)
+                       for step_size in _STEP_SIZES)
+        next_value, next_theta = min(
+            ((target_fn(candidate), candidate) for candidate in next_thetas),
+            key=lambda pair: pair[0])
 
         if abs(value - next_value) < tolerance:
             return theta
@@ -94,6 +141,19 @@ def minimize_batch(target_fn, gradient_fn, theta_0, tolerance=0.000001):
             theta, value = next_theta, next_value
 
 
+def minimize_batch(target_fn, gradient_fn, theta_0, tolerance=0.000001):
+    """
+    Use gradient descent to find theta that minimizes the target function.
+
+    Examples:
+        >>> theta = minimize_batch(lambda v: sum(v_i ** 2 for v_i in v),
+        ...                        sum_of_squares_gradient, [1, 2, 3])
+        >>> [round(t, 2) for t in theta]
+        [0.0, 0.0, 0.0]
+    """
+    return _minimize_batch(safe(target_fn), gradient_fn, theta_0, tolerance)
+
+
 def negate(f):
     """
     Return a function that for any input x returns -f(x)
@@ -111,11 +171,18 @@ def negate_all(f):
 def maximize_batch(target_fn, gradient_fn, theta_0, tolerance=0.000001):
     """
     Use gradient descent to find theta that maximizes the target function.
+
+    Examples:
+        >>> theta = maximize_batch(lambda v: -sum(v_i ** 2 for v_i in v),
+        ...                        negate_all(sum_of_squares_gradient),
+        ...                        [1, 2, 3])
+        >>> [round(t, 2) for t in theta]
+        [0.0, 0.0, 0.0]
     """
-    return minimize_batch(negate(target_fn),
-                          negate_all(gradient_fn),
-                          theta_0,
-                          tolerance)
+    return _minimize_batch(safe_negate(target_fn),
+                           negate_all(gradient_fn),
+                           theta_0,
+                           tolerance)
 
 
 """
@@ -127,7 +194,7 @@ def in_random_order(data):
     """
     Generator that returns the elements of data in random order
     """
-    indexes = [i for i, _ in enumerate(data)]
+    indexes = list(range(len(data)))
     random.shuffle(indexes)
 
     for i in indexes:
@@ -137,18 +204,33 @@ def in_random_order(data):
 def minimize_stochastic(target_fn, gradient_fn, x, y, theta_0, alpha_0=0.01):
     """
     Do Stochastic Gradient Descent via minimization.
-    """
-    data = zip(x, y)
-    theta = theta_0
+
+    Examples:
+        >>> random.seed(0)
+        >>> xs = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+        >>> ys = [3 * x_i + 1 for x_i in xs]
+        >>> def error(x_i, y_i, theta):
+        ...     return (y_i - theta[0] * x_i - theta[1]) ** 2
+        >>> def error_gradient(x_i, y_i, theta):
+        ...     e_i = y_i - theta[0] * x_i - theta[1]
+        ...     return [-2 * x_i * e_i, -2 * e_i]
+        >>> theta = minimize_stochastic(error, error_gradient, xs, ys,
+        ...                             [0, 0], 0.001)
+        >>> [round(t, 2) for t in theta]
+        [3.0, 1.0]
+    """
+    data = list(zip(x, y))
+    # theta is updated in place, so work on a copy of the caller's list.
+    theta = list(theta_0)
     alpha = alpha_0
     min_theta, min_value = None, float("inf")
     iterations_with_no_improvement = 0
 
-    while iterations_with_no_imporovement < 100:
+    while iterations_with_no_improvement < 100:
         value = sum(target_fn(x_i, y_i, theta) for x_i, y_i in data)
 
         if value < min_value:
-            min_theta, min_value = theta, value
+            min_theta, min_value = list(theta), value
             iterations_with_no_improvement = 0
             alpha = alpha_0
         else:
@@ -157,10 +239,8 @@ def minimize_stochastic(target_fn, gradient_fn, x, y, theta_0, alpha_0=0.01):
 
         for x_i, y_i in in_random_order(data):
             gradient_i = gradient_fn(x_i, y_i, theta)
-            theta = v.vector_subtract(
-                theta,
-                v.scalar_multiply(alpha, gradient_i)
-            )
+            for j, gradient_ij in enumerate(gradient_i):
+                theta[j] -= alpha * gradient_ij
 
     return min_theta
 
@@ -63,6 +63,11 @@ def get_row(matrix, i):
             ...
         IndexError: This matrix only has 2 rows but row 3 was requested.
 
+        >>> get_row(x, 2)
+        Traceback (most recent call last):
+            ...
+        IndexError: This matrix only has 2 rows but row 2 was requested.
+
         >>> y = [[1, 2, 3],[1, 2]]
         >>> get_row(y, 0)
         Traceback (most recent call last):
@@ -74,9 +79,9 @@ def get_row(matrix, i):
     if not valid_matrix:
         raise IndexError(" ".join(problems))
 
-    num_rows, _ = shape(matrix)
+    num_rows = len(matrix)
 
-    if i > num_rows:
+    if i >= num_rows:
         message = ('This matrix only has ' +
                    str(num_rows) +
                    ' rows but row ' +
@@ -108,6 +113,11 @@ def get_col(matrix, j):
             ...
         IndexError: This matrix only has 3 columns but column 4 was requested.
 
+        >>> get_col(x, 3)
+        Traceback (most recent call last):
+            ...
+        IndexError: This matrix only has 3 columns but column 3 was requested.
+
         >>> y = [[1, 2, 3],[1, 2]]
         >>> get_col(y, 0)
         Traceback (most recent call last):
@@ -119,9 +129,9 @@ def get_col(matrix, j):
     if not valid_matrix:
         raise IndexError(" ".join(problems))
 
-    _, num_cols = shape(matrix)
+    num_cols = len(matrix[0])
 
-    if j > num_cols:
+    if j >= num_cols:
         message = ('This matrix only has ' +
                    str(num_cols) +
                    ' columns but column ' +
@@ -132,6 +142,43 @@ def get_col(matrix, j):
     return [A_i[j] for A_i in matrix]
 
 
+def transpose(matrix):
+    """
+    Swap the rows and columns of a matrix.
+
+    Rows are stored as separate lists, so get_row is a single index while
+    get_col has to visit every row. Code that reads many columns should
+    transpose once and then use get_row on the result.
+
+    Args:
+        matrix (List): List of lists representing the matrix.
+
+    Returns:
+        A new matrix (List of Lists) whose ith row is the ith column of
+        matrix.
+
+    Examples:
+        >>> x = [[1, 2, 3], [4, 5, 6]]
+        >>> transpose(x)
+        [[1, 4], [2, 5], [3, 6]]
+
+        >>> get_row(transpose(x), 1) == get_col(x, 1)
+        True
+
+        >>> y = [[1, 2, 3],[1, 2]]
+        >>> transpose(y)
+        Traceback (most recent call last):
+            ...
+        IndexError: Each row must have the same number of columns.
+    """
+    valid_matrix, problems = valid.is_matrix(matrix)
+
+    if not valid_matrix:
+        raise IndexError(" ".join(problems))
+
+    return [list(column) for column in zip(*matrix)]
+
+
 def make_matrix(num_rows, num_cols, entry_fn):
     """
     Create a matrix with num_rows rows and num_cols cols and populate the
@@ -148,15 +195,32 @@ def make_matrix(num_rows, num_cols, entry_fn):
     Examples:
         >>> make_matrix(2, 2, lambda i, j: 1 if i ==j else 0)
         [[1, 0], [0, 1]]
+
+        >>> make_matrix(2, 3, is_diagonal)
+        [[1, 0, 0], [0, 1, 0]]
+
+        >>> make_matrix(2, 2, lambda i, j: [i, j])
+        Traceback (most recent call last):
+            ...
+        IndexError: One of the rows in the matrix is not a valid vector.
     """
+    if entry_fn is is_diagonal:
+        # No need to call entry_fn for every entry of an identity matrix:
+        # build rows of zeros and set the diagonal.
+        new_matrix = [[0] * num_cols for _ in range(num_rows)]
+        for i in range(min(num_rows, num_cols)):
+            new_matrix[i][i] = 1
+        return new_matrix
+
     new_matrix = [[entry_fn(i, j)
                    for j in range(num_cols)]
                   for i in range(num_rows)]
 
-    valid_matrix, problems = valid.is_matrix(new_matrix)
-
-    if not valid_matrix:
-        raise IndexError(" ".join(problems))
+    # Every row was built with num_cols entries, so only the entries
+    # themselves need checking, not the shape.
+    if not all(map(valid.is_vector, new_matrix)):
+        raise IndexError('One of the rows in the matrix is not ' +
+                         'a valid vector.')
 
     return new_matrix
 
@@ -3,12 +3,49 @@ This module contains statistics functions.
 """
 
 from collections import Counter
+import functools
 import math
+import sys
 
-from vector import sum_of_squares, dot
 import validator as valid
 
 
+def _check_numeric(*vectors):
+    """
+    Raise this module's usual errors unless every vector holds only Int or
+    Float values. Valid input is scanned once; only failing input is
+    scanned again, to tell a malformed vector from one holding strings.
+    """
+    if all(map(valid.is_numeric_vector, vectors)):
+        return
+
+    if not all(map(valid.is_vector, vectors)):
+        raise IndexError("The vector passed is not a valid vector")
+
+    message = ("The vector passed must contains either " +
+               "Int or Float values.")
+    raise TypeError(message)
+
+
+def _numeric_vector(function):
+    """
+    Decorator for functions whose first argument must be a numeric vector.
+    The vector is checked by _check_numeric before the function runs.
+    """
+    @functools.wraps(function)
+    def checked(vector, *args, **kwargs):
+        _check_numeric(vector)
+        return function(vector, *args, **kwargs)
+    return checked
+
+
+def _mean(vector):
+    """
+    The arithmetic mean of a vector that has already been validated.
+    """
+    return sum(vector) / len(vector)
+
+
 def mean(vector):
     """
     Return the simple arithmatic mean of a vector.
@@ -35,10 +72,25 @@ def mean(vector):
             ...
         IndexError: The vector passed is not a valid vector
     """
-    if not (valid.is_vector(vector) and valid.is_vector(vector)):
+    if not valid.is_vector(vector):
         raise IndexError("The vector passed is not a valid vector")
 
-    return sum(vector) / len(vector)
+    return _mean(vector)
+
+
+def _median_of_sorted(sorted_vector):
+    """
+    The median of a validated, already sorted vector.
+    """
+    elements = len(sorted_vector)
+    midpoint = elements // 2
+
+    if elements % 2 == 1:
+        return float(sorted_vector[midpoint])
+    else:
+        low = midpoint - 1
+        hih = midpoint
+        return _mean([sorted_vector[low], sorted_vector[hih]])
 
 
 def median(vector):
@@ -71,19 +123,18 @@ def median(vector):
             ...
         IndexError: The vector passed is not a valid vector
     """
-    if not (valid.is_vector(vector) and valid.is_vector(vector)):
+    if not valid.is_vector(vector):
         raise IndexError("The vector passed is not a valid vector")
 
-    elements = len(vector)
-    sorted_vector = sorted(vector)
-    midpoint = elements // 2
+    return _median_of_sorted(sorted(vector))
 
-    if elements % 2 == 1:
-        return float(sorted_vector[midpoint])
-    else:
-        low = midpoint - 1
-        hih = midpoint
-        return mean([sorted_vector[low], sorted_vector[hih]])
+
+def _quantile_of_sorted(sorted_vector, percentile):
+    """
+    The percentile value of a validated, already sorted vector. quantile,
+    interquartile_range and describe all pick their values through here.
+    """
+    return sorted_vector[int(percentile * len(sorted_vector))]
 
 
 def quantile(vector, percentile):
@@ -126,12 +177,10 @@ def quantile(vector, percentile):
                    '(0.0 < percentile < 1.0)')
         raise ValueError(message)
 
-    if not (valid.is_vector(vector) and valid.is_vector(vector)):
+    if not valid.is_vector(vector):
         raise IndexError("The vector passed is not a valid vector")
 
-    p_index = int(percentile * len(vector))
-
-    return sorted(vector)[p_index]
+    return _quantile_of_sorted(sorted(vector), percentile)
 
 
 def mode(vector):
@@ -160,7 +209,7 @@ def mode(vector):
             ...
         IndexError: The vector passed is not a valid vector
     """
-    if not (valid.is_vector(vector) and valid.is_vector(vector)):
+    if not valid.is_vector(vector):
         raise IndexError("The vector passed is not a valid vector")
 
     counts = Counter(vector)
@@ -170,6 +219,7 @@ def mode(vector):
             if count == max_count]
 
 
+@_numeric_vector
 def data_range(vector):
     """
     Returns max(vector) - min(vector). Only works for vectors containing
@@ -202,17 +252,10 @@ def data_range(vector):
             ...
         IndexError: The vector passed is not a valid vector
     """
-    if not (valid.is_vector(vector) and valid.is_vector(vector)):
-        raise IndexError("The vector passed is not a valid vector")
-
-    if any(isinstance(i, str) for i in vector):
-        message = ("The vector passed must contains either " +
-                   "Int or Float values.")
-        raise TypeError(message)
-
     return max(vector) - min(vector)
 
 
+@_numeric_vector
 def de_mean(vector):
     """
     Translate the vector by subtracting its mean, so the result has mean=0.
@@ -240,19 +283,25 @@ def de_mean(vector):
             ...
         IndexError: The vector passed is not a valid vector
     """
-    if not (valid.is_vector(vector) and valid.is_vector(vector)):
-        raise IndexError("The vector passed is not a valid vector")
+    x_bar = _mean(vector)
 
-    if any(isinstance(i, str) for i in vector):
-        message = ("The vector passed must contains either " +
-                   "Int or Float values.")
-        raise TypeError(message)
+    return [x_i - x_bar for x_i in vector]
 
-    x_bar = mean(vector)
 
-    return [x_i - x_bar for x_i in vector]
+def _variance(vector):
+    """
+    The sample variance of a validated numeric vector of length >= 2.
+    """
+    num_elements = len(vector)
+    x_bar = _mean(vector)
+
+    # Square the deviations as they are generated rather than building the
+    # de_mean list and walking it again in sum_of_squares.
+    return (sum((x_i - x_bar) * (x_i - x_bar) for x_i in vector) /
+            (num_elements - 1))
 
 
+@_numeric_vector
 def variance(vector):
     """
     Calculate the variance of a vector with length >= 2.
@@ -286,24 +335,13 @@ def variance(vector):
             ...
         IndexError: The vector must contain at least two values
     """
-    if not (valid.is_vector(vector) and valid.is_vector(vector)):
-        raise IndexError("The vector passed is not a valid vector")
-
-    if any(isinstance(i, str) for i in vector):
-        message = ("The vector passed must contains either " +
-                   "Int or Float values.")
-        raise TypeError(message)
-
     if len(vector) < 2:
         raise IndexError("The vector must contain at least two values")
 
-    num_elements = len(vector)
-
-    deviations = de_mean(vector)
-
-    return sum_of_squares(deviations) / (num_elements - 1)
+    return _variance(vector)
 
 
+@_numeric_vector
 def standard_deviation(vector):
     """
     Computes the standard deviation of a vector.
@@ -337,20 +375,13 @@ def standard_deviation(vector):
             ...
         IndexError: The vector must contain at least two values
     """
-    if not (valid.is_vector(vector) and valid.is_vector(vector)):
-        raise IndexError("The vector passed is not a valid vector")
-
-    if any(isinstance(i, str) for i in vector):
-        message = ("The vector passed must contains either " +
-                   "Int or Float values.")
-        raise TypeError(message)
-
     if len(vector) < 2:
         raise IndexError("The vector must contain at least two values")
 
-    return math.sqrt(variance(vector))
+    return math.sqrt(_variance(vector))
 
 
+@_numeric_vector
 def interquartile_range(vector):
     """
     Calculates the difference between the 75th and 25th percentile.
@@ -378,15 +409,25 @@ def interquartile_range(vector):
             ...
         IndexError: The vector passed is not a valid vector
     """
-    if not (valid.is_vector(vector) and valid.is_vector(vector)):
-        raise IndexError("The vector passed is not a valid vector")
+    # Sort once and read both quartiles, rather than sorting in each
+    # quantile() call.
+    sorted_vector = sorted(vector)
 
-    if any(isinstance(i, str) for i in vector):
-        message = ("The vector passed must contains either " +
-                   "Int or Float values.")
-        raise TypeError(message)
+    return (_quantile_of_sorted(sorted_vector, 0.75) -
+            _quantile_of_sorted(sorted_vector, 0.25))
+
+
+def _covariance(v_1, v_2):
+    """
+    The sample covariance of two validated numeric vectors of equal length.
+    """
+    num_elements = len(v_1)
+    x_bar = _mean(v_1)
+    y_bar = _mean(v_2)
 
-    return quantile(vector, 0.75) - quantile(vector, 0.25)
+    return (sum((x_i - x_bar) * (y_i - y_bar)
+                for x_i, y_i in zip(v_1, v_2)) /
+            (num_elements - 1))
 
 
 def covariance(v_1, v_2):
@@ -426,19 +467,9 @@ def covariance(v_1, v_2):
     if not len(v_1) == len(v_2):
         raise IndexError("The two vectors must be the same length.")
 
-    if not (valid.is_vector(v_1) and valid.is_vector(v_2)):
-        raise IndexError("The vector passed is not a valid vector")
+    _check_numeric(v_1, v_2)
 
-    chk = v_1.copy()
-    chk.extend(v_2)
-    if any(isinstance(i, str) for i in chk):
-        message = ("The vector passed must contains either " +
-                   "Int or Float values.")
-        raise TypeError(message)
-
-    num_elements = len(v_1)
-
-    return dot(de_mean(v_1), de_mean(v_2)) / (num_elements - 1)
+    return _covariance(v_1, v_2)
 
 
 def correlation(v_1, v_2):
@@ -457,6 +488,12 @@ def correlation(v_1, v_2):
         >>> correlation(x, y)
         -1.0
 
+        >>> correlation([0, 1e-100, 2e-100], [0, 1e-100, 2e-100])
+        1.0
+
+        >>> correlation([0, 1e100, 2e100], [0, 1e100, 2e100])
+        1.0
+
         >>> z = [1, 2]
         >>> correlation(x, z)
         Traceback (most recent call last):
@@ -478,20 +515,84 @@ def correlation(v_1, v_2):
     if not len(v_1) == len(v_2):
         raise IndexError("The two vectors must be the same length.")
 
-    if not (valid.is_vector(v_1) and valid.is_vector(v_2)):
-        raise IndexError("The vector passed is not a valid vector")
+    _check_numeric(v_1, v_2)
 
-    chk = v_1.copy()
-    chk.extend(v_2)
-    if any(isinstance(i, str) for i in chk):
-        message = ("The vector passed must contains either " +
-                   "Int or Float values.")
-        raise TypeError(message)
+    if len(v_1) < 2:
+        raise IndexError("The vector must contain at least two values")
 
-    sd_v_1 = standard_deviation(v_1)
-    sd_v_2 = standard_deviation(v_2)
+    x_bar = _mean(v_1)
+    y_bar = _mean(v_2)
 
-    if sd_v_1 > 0 and sd_v_2 > 0:
-        return covariance(v_1, v_2) / sd_v_1 / sd_v_2
-    else:
+    # One pass accumulates the co-deviation and both sums of squared
+    # deviations; the (n - 1) factors cancel, so no division per term.
+    sum_xy = sum_xx = sum_yy = 0.0
+    for x_i, y_i in zip(v_1, v_2):
+        dx_i = x_i - x_bar
+        dy_i = y_i - y_bar
+        sum_xy += dx_i * dy_i
+        sum_xx += dx_i * dx_i
+        sum_yy += dy_i * dy_i
+
+    if not (sum_xx > 0 and sum_yy > 0):
         return 0
+
+    # A single root of the product rounds once, but the product itself can
+    # underflow or overflow for very small or very large deviations; take
+    # the roots separately in that case.
+    denominator = sum_xx * sum_yy
+    if sys.float_info.min <= denominator <= sys.float_info.max:
+        return sum_xy / math.sqrt(denominator)
+    else:
+        return sum_xy / (math.sqrt(sum_xx) * math.sqrt(sum_yy))
+
+
+@_numeric_vector
+def describe(vector):
+    """
+    Summarise a numeric vector. The vector is validated once and sorted
+    once, and every order statistic is read from that single sort, which is
+    cheaper than calling median, quantile and friends one at a time.
+
+    Args:
+        vector (List): A vector containing 2 or more Int or Float values.
+
+    Returns:
+        A Dict with the mean, median, first_quartile, third_quartile and
+        standard_deviation of the vector.
+
+    Examples:
+        >>> x = [*range(10)]
+        >>> describe(x) # doctest: +NORMALIZE_WHITESPACE
+        {'mean': 4.5, 'median': 4.5, 'first_quartile': 2,
+         'third_quartile': 7, 'standard_deviation': 3.0276503540974917}
+
+        >>> y = ['a', 'b', 'c']
+        >>> describe(y) # doctest: +NORMALIZE_WHITESPACE
+        Traceback (most recent call last):
+            ...
+        TypeError: The vector passed must contains either Int or Float values.
+
+        >>> z = [1, 2, [1, 2]]
+        >>> describe(z)
+        Traceback (most recent call last):
+            ...
+        IndexError: The vector passed is not a valid vector
+
+        >>> zz = [1]
+        >>> describe(zz)
+        Traceback (most recent call last):
+            ...
+        IndexError: The vector must contain at least two values
+    """
+    if len(vector) < 2:
+        raise IndexError("The vector must contain at least two values")
+
+    sorted_vector = sorted(vector)
+
+    return {
+        'mean': _mean(vector),
+        'median': _median_of_sorted(sorted_vector),
+        'first_quartile': _quantile_of_sorted(sorted_vector, 0.25),
+        'third_quartile': _quantile_of_sorted(sorted_vector, 0.75),
+        'standard_deviation': math.sqrt(_variance(vector)),
+    }
@@ -23,12 +23,13 @@ def two_sided_p_value(x, mu=0, sigma=1):
 
     Examples:
         >>> two_sided_p_value(529.5, 500, 15.811388300841896)
-        0.06207721579598857
+        0.06207721579598832
+
+        >>> two_sided_p_value(470.5, 500, 15.811388300841896)
+        0.06207721579598832
     """
-    if x >= mu:
-        return 2 * d.normal_probability_above(x, mu, sigma)
-    else:
-        return 2 * d.normal_probability_below(x, mu, sigma)
+    # The normal is symmetric about mu, so reflect x into the upper tail.
+    return 2 * d.normal_probability_above(mu + abs(x - mu), mu, sigma)
 
 
 upper_p_value = d.normal_probability_above
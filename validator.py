@@ -3,6 +3,26 @@ This functions in this module perform validation to check that their inputs
 of the needed types for this project.
 """
 
+from array import array
+from itertools import repeat
+
+# The element types a vector may hold. bool is a subclass of int, so
+# booleans are accepted too.
+_VECTOR_TYPES = (str, int, float)
+_NUMERIC_TYPES = (int, float)
+
+
+def _is_numeric_ndarray(to_check):
+    """
+    True for a one-dimensional numpy array of bool, integer or float dtype.
+    Checked through attributes so that numpy is not imported here.
+    """
+    # Other array-likes (torch tensors, for one) have a dtype without a
+    # kind; those fall through to the element by element check.
+    kind = getattr(getattr(to_check, 'dtype', None), 'kind', None)
+    return (getattr(to_check, 'ndim', None) == 1
+            and kind in ('b', 'i', 'u', 'f'))
+
 
 def is_vector(to_check):
     """
@@ -32,11 +52,69 @@ def is_vector(to_check):
         >>> z = [1, 2, [1, 2]]
         >>> is_vector(z)
         False
+
+        >>> is_vector([True, False])
+        True
+
+        >>> from array import array
+        >>> is_vector(array('d', [1.0, 2.0, 3.0]))
+        True
+
+        >>> class Column:  # Stands in for a numpy array; nothing to iterate.
+        ...     ndim = 1
+        ...     class dtype:
+        ...         kind = 'f'
+        >>> is_vector(Column())
+        True
     """
-    return all((isinstance(i, str) or
-                isinstance(i, int) or
-                isinstance(i, float))
-               for i in to_check)
+    # An array.array can only hold numbers (or characters for typecode 'u'),
+    # and a numeric ndarray's dtype says the same, so there is nothing to
+    # check element by element.
+    if isinstance(to_check, array) or _is_numeric_ndarray(to_check):
+        return True
+
+    return all(map(isinstance, to_check, repeat(_VECTOR_TYPES)))
+
+
+def is_numeric_vector(to_check):
+    """
+    Checks if the argument is a vector whose contents are all numbers, that
+    is Int or Float.
+
+    Args:
+        to_check (List): The list to check.
+
+    Returns:
+        Boolean.
+
+    Examples:
+        >>> is_numeric_vector([1, 2.0, 3])
+        True
+
+        >>> is_numeric_vector(['a', 'b', 'c'])
+        False
+
+        >>> is_numeric_vector([1, 2, [1, 2]])
+        False
+
+        >>> from array import array
+        >>> is_numeric_vector(array('d', [1.0, 2.0, 3.0]))
+        True
+
+        >>> class Column:  # Stands in for a numpy array; nothing to iterate.
+        ...     ndim = 1
+        ...     class dtype:
+        ...         kind = 'f'
+        >>> is_numeric_vector(Column())
+        True
+    """
+    if isinstance(to_check, array):
+        return to_check.typecode != 'u'
+
+    if _is_numeric_ndarray(to_check):
+        return True
+
+    return all(map(isinstance, to_check, repeat(_NUMERIC_TYPES)))
 
 
 def is_matrix(to_check):
@@ -82,13 +160,13 @@ def is_matrix(to_check):
     """
     collector = []
 
-    if not all(is_vector(i) for i in to_check):
+    if not all(map(is_vector, to_check)):
         collector.append('One of the rows in the matrix is not ' +
                          'a valid vector.')
 
     num_cols = len(to_check[0])
 
-    if any([len(a) != num_cols for a in to_check]):
+    if any(len(row) != num_cols for row in to_check):
         collector.append('Each row must have the same number of columns.')
 
     valid_matrix = not bool(collector)
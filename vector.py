@@ -4,7 +4,40 @@ This module provides the necessary functionality for working with vectors.
 import math
 import validator as valid
 
+from array import array
 from functools import reduce
+from operator import add, mul, sub
+
+
+def _check_vector(v):
+    """
+    Raise IndexError unless v is a valid vector.
+    """
+    if not valid.is_vector(v):
+        raise IndexError("The vector passed is not a valid vector")
+
+
+def _check_pair(v1, v2):
+    """
+    Raise IndexError unless v1 and v2 are valid vectors of equal length.
+    """
+    # The length comparison is O(1), so make it before scanning the elements.
+    if len(v1) != len(v2):
+        raise IndexError('Vectors must be the same length')
+
+    if not (valid.is_vector(v1) and valid.is_vector(v2)):
+        raise IndexError("One of the vectors passed is not a valid vector")
+
+
+def _check_all(vectors):
+    """
+    Raise IndexError unless vectors are all valid and of equal length.
+    """
+    if len(set(map(len, vectors))) > 1:
+        raise IndexError('Vectors must be the same length')
+
+    if not all(map(valid.is_vector, vectors)):
+        raise IndexError("One of the vectors passed is not a valid vector")
 
 
 def vector_add(v1, v2):
@@ -36,14 +69,9 @@ def vector_add(v1, v2):
             ...
         IndexError: One of the vectors passed is not a valid vector
     """
-    if not (valid.is_vector(v1) and valid.is_vector(v2)):
-        raise IndexError("One of the vectors passed is not a valid vector")
+    _check_pair(v1, v2)
 
-    if len(v1) != len(v2):
-        raise IndexError('Vectors must be the same length')
-
-    return [v1_i + v2_i
-            for v1_i, v2_i in zip(v1, v2)]
+    return list(map(add, v1, v2))
 
 
 def vector_subtract(v1, v2):
@@ -79,14 +107,9 @@ def vector_subtract(v1, v2):
             ...
         IndexError: One of the vectors passed is not a valid vector
     """
-    if not (valid.is_vector(v1) and valid.is_vector(v2)):
-        raise IndexError("One of the vectors passed is not a valid vector")
-
-    if len(v1) != len(v2):
-        raise IndexError('Vectors must be the same length')
+    _check_pair(v1, v2)
 
-    return [v1_i - v2_i
-            for v1_i, v2_i in zip(v1, v2)]
+    return list(map(sub, v1, v2))
 
 
 def vector_sum(vectors):
@@ -108,6 +131,9 @@ def vector_sum(vectors):
         >>> vector_sum(myVecs)
         [3, 6, 9]
 
+        >>> vector_sum([['a', 'b'], ['c', 'd']])
+        ['ac', 'bd']
+
         >>> z = [1, 3]
         >>> myVecs = [w, x, y, z]
         >>> vector_sum(myVecs)
@@ -121,14 +147,12 @@ def vector_sum(vectors):
             ...
         IndexError: One of the vectors passed is not a valid vector
     """
-    if not all(valid.is_vector(v) for v in vectors):
-        raise IndexError("One of the vectors passed is not a valid vector")
+    _check_all(vectors)
 
-    lengthToTest = len(vectors[0])
-    if any(len(v) != lengthToTest for v in vectors[1:]):
-        raise IndexError('Vectors must be the same length')
-
-    return reduce(vector_add, vectors)
+    # Fold each column rather than folding vector_add over the rows, which
+    # would build and re-validate an intermediate list per row. reduce keeps
+    # the left-fold semantics of +, so string vectors concatenate.
+    return [reduce(add, column) for column in zip(*vectors)]
 
 
 def scalar_multiply(v, sc):
@@ -155,8 +179,7 @@ def scalar_multiply(v, sc):
             ...
         IndexError: The vector passed is not a valid vector
     """
-    if not valid.is_vector(v):
-        raise IndexError("The vector passed is not a valid vector")
+    _check_vector(v)
 
     return [i * sc for i in v]
 
@@ -194,12 +217,26 @@ def vector_mean(vectors):
         Traceback (most recent call last):
             ...
         IndexError: One of the vectors passed is not a valid vector
+
+        >>> vector_mean([])
+        Traceback (most recent call last):
+            ...
+        IndexError: The mean of no vectors is undefined
     """
-    if not all(valid.is_vector(v) for v in vectors):
-        raise IndexError("One of the vectors passed is not a valid vector")
+    if not vectors:
+        raise IndexError("The mean of no vectors is undefined")
+
+    _check_all(vectors)
 
     n = len(vectors)
-    return scalar_multiply(vector_sum(vectors), 1/n)
+    return [reduce(add, column) / n for column in zip(*vectors)]
+
+
+def _dot(v1, v2):
+    """
+    Dot product kernel; callers are responsible for validation.
+    """
+    return sum(map(mul, v1, v2))
 
 
 def dot(v1, v2):
@@ -231,14 +268,9 @@ def dot(v1, v2):
             ...
         IndexError: One of the vectors passed is not a valid vector
     """
-    if not (valid.is_vector(v1) and valid.is_vector(v2)):
-        raise IndexError("One of the vectors passed is not a valid vector")
+    _check_pair(v1, v2)
 
-    if not len(v1) == len(v2):
-        raise IndexError('Vectors must be the same length')
-
-    return sum(v1_i * v2_i
-               for v1_i, v2_i in zip(v1, v2))
+    return _dot(v1, v2)
 
 
 def sum_of_squares(v):
@@ -262,10 +294,9 @@ def sum_of_squares(v):
             ...
         IndexError: The vector passed is not a valid vector
     """
-    if not valid.is_vector(v):
-        raise IndexError("The vector passed is not a valid vector")
+    _check_vector(v)
 
-    return dot(v, v)
+    return _dot(v, v)
 
 
 def magnitude(v):
@@ -289,10 +320,16 @@ def magnitude(v):
             ...
         IndexError: The vector passed is not a valid vector
     """
-    if not valid.is_vector(v):
-        raise IndexError("The vector passed is not a valid vector")
+    _check_vector(v)
 
-    return math.sqrt(sum_of_squares(v))
+    return math.hypot(*v)
+
+
+def _squared_distance(v1, v2):
+    """
+    Squared distance kernel; callers are responsible for validation.
+    """
+    return sum(d * d for d in map(sub, v1, v2))
 
 
 def squared_distance(v1, v2):
@@ -318,10 +355,9 @@ def squared_distance(v1, v2):
             ...
         IndexError: One of the vectors passed is not a valid vector
     """
-    if not (valid.is_vector(v1) and valid.is_vector(v2)):
-        raise IndexError("One of the vectors passed is not a valid vector")
+    _check_pair(v1, v2)
 
-    return sum_of_squares(vector_subtract(v1, v2))
+    return _squared_distance(v1, v2)
 
 
 def distance(v1, v2):
@@ -346,7 +382,72 @@ def distance(v1, v2):
             ...
         IndexError: One of the vectors passed is not a valid vector
     """
-    if not (valid.is_vector(v1) and valid.is_vector(v2)):
-        raise IndexError("One of the vectors passed is not a valid vector")
+    _check_pair(v1, v2)
+
+    return math.dist(v1, v2)
+
+
+def distances(vectors, w):
+    """
+    Compute the distance from each of several vectors to a single vector.
+
+    Prefer this to calling distance in a loop: the inputs are validated once
+    for the whole batch and each distance is computed by math.dist.
+
+    Args:
+        vectors (List): The vectors to measure from. Each must be the same
+            length as w.
+        w (List): The vector to measure to.
+
+    Returns:
+        A List of the distances, one per vector in vectors.
+
+    Examples:
+        >>> distances([[1, 2, 3], [3, 2, 1], [1, 1, 1]], [3, 2, 1])
+        [2.8284271247461903, 0.0, 2.23606797749979]
+
+        >>> distances([[1, 2, 3], [1, 2]], [3, 2, 1])
+        Traceback (most recent call last):
+            ...
+        IndexError: Vectors must be the same length
+
+        >>> distances([[1, 2, 3]], [1, 2, [1, 2]])
+        Traceback (most recent call last):
+            ...
+        IndexError: One of the vectors passed is not a valid vector
+    """
+    _check_all([w, *vectors])
+
+    return [math.dist(v, w) for v in vectors]
+
+
+def to_vec(v):
+    """
+    Validate a numeric vector once and pack it into an array of doubles.
+
+    The functions in this module accept the result anywhere they accept a
+    List, and since an array can only hold numbers they skip the element by
+    element validation scan on every later call.
+
+    Args:
+        v (List): The numeric vector to pack.
+
+    Returns:
+        An array.array with typecode 'd' holding the elements of v as Floats.
+
+    Examples:
+        >>> x = to_vec([1, 2, 3])
+        >>> x
+        array('d', [1.0, 2.0, 3.0])
+        >>> dot(x, x)
+        14.0
+
+        >>> to_vec(['a', 'b', 'c'])
+        Traceback (most recent call last):
+            ...
+        IndexError: The vector passed is not a valid numeric vector
+    """
+    if not valid.is_numeric_vector(v):
+        raise IndexError("The vector passed is not a valid numeric vector")
 
-    return magnitude(vector_subtract(v1, v2))
+    return array('d', v)